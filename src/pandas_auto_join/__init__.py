@@ -1,16 +1,27 @@
 import traceback
+import re
+import warnings
 import logging
 import pandas as pd
 import numpy as np
 
 from pandas_auto_join import config
 from difflib import SequenceMatcher
-from Levenshtein import ratio, jaro, jaro_winkler, seqratio, setratio, matching_blocks, editops
+from Levenshtein import jaro, seqratio, setratio, matching_blocks, editops
+from rapidfuzz.process import cdist
+from rapidfuzz.distance import Indel, JaroWinkler
 from typing import Tuple
+from itertools import product
 from tqdm import tqdm
 
 __version__ = "1.0.0"
 
+# Unnecessary symbols and whitespaces, replaced by a single space in one pass
+CLEAN_REGEX = re.compile(r'[\s;()\[\]"\']+')
+
+# Max number of similarity scores computed at once (rows of score matrix are computed in blocks)
+SIMILARITY_BLOCK_SIZE = 2 ** 22
+
 def join(
     *args: Tuple[pd.DataFrame], 
     how: str = 'inner',
@@ -54,37 +65,51 @@ def join(
                 other_df = df.drop_duplicates()
 
                 # Find number join keys
+                # (helpers only add new key columns, so a shallow copy is sufficient)
                 main_df, other_df = __extract_dtypes(
-                    df1         = main_df.copy(),
-                    df2         = other_df.copy()    
+                    df1         = main_df.copy(deep=False),
+                    df2         = other_df.copy(deep=False)
                 )
 
                 # Find (similarity) string join keys
                 main_df, other_df = __generate_similarity(
-                    df1         = main_df.copy(),
-                    df2         = other_df.copy(),
+                    df1         = main_df.copy(deep=False),
+                    df2         = other_df.copy(deep=False),
                     algo        = strategy,
                     threshold   = threshold
                 )
 
                 # Find overlap possible keys
                 left_key, right_key = __join_keys(
-                    df1         = main_df.copy(),
-                    df2         = other_df.copy()
+                    df1         = main_df,
+                    df2         = other_df
                 )
 
-                # Merge other_df to main_df
+                # Merge other_df to main_df (only data columns and selected join keys)
                 index_name = main_df.index.name
-                main_df = pd.merge(
-                    left        = main_df.dropna(subset=left_key),
-                    right       = other_df.dropna(subset=right_key),
-                    left_on     = left_key,
-                    right_on    = right_key,
-                    how         = how,
-                    suffixes    = ('','_duplicated')
-                )
+                left_columns = list(__split_columns(main_df)[1]) + list(dict.fromkeys(left_key))
+                right_columns = list(__split_columns(other_df)[1]) + list(dict.fromkeys(right_key))
+                left_df = main_df.dropna(subset=left_key)[left_columns]
+                right_df = other_df.dropna(subset=right_key)[right_columns]
+                if how == 'left' and __is_lookup(left_df, right_df, left_key, right_key):
+                    main_df = __lookup_join(
+                        df1         = left_df,
+                        df2         = right_df,
+                        left_key    = left_key,
+                        right_key   = right_key
+                    )
+                else:
+                    main_df = pd.merge(
+                        left        = left_df,
+                        right       = right_df,
+                        left_on     = left_key,
+                        right_on    = right_key,
+                        how         = how,
+                        sort        = False,
+                        suffixes    = ('','_duplicated')
+                    )
                 main_df.index.name = index_name
-                main_df = main_df.loc[:,~main_df.columns.str.startswith(config.setting['JOIN_PREFIX'])]
+                main_df = main_df.drop(columns=__split_columns(main_df)[0])
 
                 if config.setting['VERBOSE']: logging.info(f"Added {len(other_df[right_key].dropna())} new unique values to dataframe.")
 
@@ -126,7 +151,13 @@ def __extract_dtypes(
         for column in df.select_dtypes(include='number').columns:
             df[__column_name(df, column)] = pd.to_numeric(df[column].replace('.','').replace(',','.'), downcast='float', errors='coerce')
 
-        for column in df.select_dtypes(include='object', exclude='number').columns:
+        for column in df.select_dtypes(include=['object', 'string'], exclude='number').columns:
+            # Skip columns early, which cant be completely converted to dates
+            if df[column].isna().any(): continue
+            with warnings.catch_warnings():
+                # Format warnings are raised by parsing full column below
+                warnings.simplefilter('ignore')
+                if pd.to_datetime(df[column].head(100), errors='coerce').isna().any(): continue
             dates = pd.to_datetime(df[column], errors='coerce')
 
             if not dates.isna().any():
@@ -166,53 +197,85 @@ def __generate_similarity(
     Tuple[pd.DataFrame, pd.DataFrame]
         Dataframe with similar text matches
     """
-    def clean_regex() -> str:
-        """Regular expression (regex) for removing unnecessary symbols."""
-        return '[\;\(\)\[\]\"\']+'
-
-    def preprocessing(x: object) -> str:
+    def clean(series: pd.Series) -> pd.Series:
         """String preparation before similarity matching."""
-        return str(x).upper().strip()
+        return series.replace(CLEAN_REGEX, ' ', regex=True).astype(object).astype(str).str.upper().str.strip()
     
-    def calc_similarity(str1, str2):
-        """Return similarity between two strings for different algorithm.""" 
+    def set_similarity(str1, str2, **kwargs):
+        """Set similarity between two strings, with scorer signature of rapidfuzz."""
+        return setratio(str1, str2)
+
+    def scorer():
+        """Return similarity scorer between two strings for different algorithm."""
         if algo == 'jaro':
-            score = jaro_winkler(str1, str2)
+            return JaroWinkler.normalized_similarity
         elif algo == 'sets':
-            score = setratio(str1, str2)
+            return set_similarity
         else:
             # Levensthein
-            score = ratio(str1, str2)
-        
-        return score
-
-    def best_match(str1, series, first):
-        sim_score = series.apply(lambda y: calc_similarity(str1,y))
-        max_sim = sim_score.max()
+            return Indel.normalized_similarity
+
+    def best_scores(unique1, unique2):
+        """Return index and score of best similar match for both directions.
+        Score matrix is computed in row blocks, to keep memory independent of the number of strings."""
+        max_idx1, max_sim1 = np.zeros(len(unique1), dtype=np.intp), np.full(len(unique1), -np.inf)
+        max_idx2, max_sim2 = np.zeros(len(unique2), dtype=np.intp), np.full(len(unique2), -np.inf)
+
+        rows = max(1, SIMILARITY_BLOCK_SIZE // max(1, len(unique2)))
+        for start in range(0, len(unique1), rows):
+            # Similarity is symmetric, so one score matrix (on all cores) serves both directions
+            scores = cdist(unique1[start:start+rows], unique2, scorer=scorer(), dtype=np.float64, workers=-1)
+
+            block_idx = scores.argmax(axis=1)
+            max_idx1[start:start+rows] = block_idx
+            max_sim1[start:start+rows] = scores[np.arange(len(block_idx)), block_idx]
+
+            # Keep first best match on equal scores, like argmax over the full matrix
+            block_idx = scores.argmax(axis=0)
+            block_sim = scores[block_idx, np.arange(len(block_idx))]
+            better = block_sim > max_sim2
+            max_idx2[better] = block_idx[better] + start
+            max_sim2[better] = block_sim[better]
+
+        return (max_idx1, max_sim1), (max_idx2, max_sim2)
+
+    def best_match(unique1, unique2, max_idx, max_sim, first):
+        """Return best similar match in unique2 for each string of unique1."""
+        matches = []
+        for str1, idx, sim in zip(unique1, max_idx, max_sim):
+            if sim < threshold:
+                matches.append(None)
+                continue
+            str2 = unique2[idx]
+            # Generate equal matching string (switch between df 0 and 1)
+            if first:
+                mb = matching_blocks(editops(str1,str2), str1, str2)
+                match_str = ''.join([str1[x[0]:x[0]+x[2]] for x in mb])
+            else:
+                mb = matching_blocks(editops(str2,str1), str2, str1)
+                match_str = ''.join([str2[x[0]:x[0]+x[2]] for x in mb])
+            matches.append(match_str)
 
-        str2 = series[sim_score.idxmax()]
-        # Generate equal matching string (switch between df 0 and 1)
-        if first:
-            mb = matching_blocks(editops(str1,str2), str1, str2)
-            match_str = ''.join([str1[x[0]:x[0]+x[2]] for x in mb])
-        else:
-            mb = matching_blocks(editops(str2,str1), str2, str1)
-            match_str = ''.join([str2[x[0]:x[0]+x[2]] for x in mb])
+        return np.array(matches, dtype=object)
 
-        return match_str if max_sim >= threshold else None
+    keys1, data1 = __split_columns(df1)
+    keys2, data2 = __split_columns(df2)
+    col1 = data1.drop(keys1.str.replace(__column_name(df1,''),''))
+    col2 = data2.drop(keys2.str.replace(__column_name(df2,''),''))
+    combinations = product(col1, col2)
 
-    col1 = df1.loc[:, df1.columns.str.startswith(config.setting['JOIN_PREFIX'])].columns
-    col2 = df2.loc[:, df2.columns.str.startswith(config.setting['JOIN_PREFIX'])].columns
-    col1 = df1.drop(columns=col1).drop(columns=col1.str.replace(__column_name(df1,''),'')).columns
-    col2 = df2.drop(columns=col2).drop(columns=col2.str.replace(__column_name(df2,''),'')).columns
-    combinations = np.array(np.meshgrid(col1, col2)).T.reshape(-1, 2)
+    # Clean each column once and only compare unique strings, mapped back to each row by codes
+    factorized1 = {column: pd.factorize(clean(df1[column]).to_numpy()) for column in col1}
+    factorized2 = {column: pd.factorize(clean(df2[column]).to_numpy()) for column in col2}
 
     for combination in combinations:
-        series1 = df1[combination[0]].replace(clean_regex(), ' ', regex=True).replace('\s+',' ', regex=True).apply(preprocessing)
-        series2 = df2[combination[1]].replace(clean_regex(), ' ', regex=True).replace('\s+',' ', regex=True).apply(preprocessing)
+        codes1, unique1 = factorized1[combination[0]]
+        codes2, unique2 = factorized2[combination[1]]
+
+        best1, best2 = best_scores(unique1, unique2)
 
-        df1[__column_name(df1, f"{combination[0]}<->{combination[1]}")] = series1.apply(lambda x: best_match(x, series2, True))
-        df2[__column_name(df2, f"{combination[0]}<->{combination[1]}")] = series2.apply(lambda x: best_match(x, series1, False))
+        df1[__column_name(df1, f"{combination[0]}<->{combination[1]}")] = pd.Series(best_match(unique1, unique2, *best1, True)[codes1], index=df1.index, dtype=object)
+        df2[__column_name(df2, f"{combination[0]}<->{combination[1]}")] = pd.Series(best_match(unique2, unique1, *best2, False)[codes2], index=df2.index, dtype=object)
 
     return df1.dropna(axis=1,how='all'), df2.dropna(axis=1,how='all')
 
@@ -241,32 +304,61 @@ def __join_keys(
     Exception
         Didnt find any possible join key
     """
-    col1 = df1.loc[:, df1.columns.str.startswith(config.setting['JOIN_PREFIX'])].columns
-    col2 = df2.loc[:, df2.columns.str.startswith(config.setting['JOIN_PREFIX'])].columns
-    combinations = np.array(np.meshgrid(col1, col2)).T.reshape(-1, 2)
-
-    intersection_len = {}
+    def unique_values(series: pd.Series) -> np.ndarray:
+        """Unique values of column, sorted for number and date columns."""
+        values = series.to_numpy()
+        return np.unique(values) if values.dtype.kind in 'biufmM' else pd.unique(values)
+
+    def intersection_count(values1: np.ndarray, values2: np.ndarray) -> int:
+        """Count of shared unique values between two columns."""
+        if values1.dtype.kind in 'biufmM' and values2.dtype.kind in 'biufmM':
+            # Both sorted, so lookup each value by binary search without hashing
+            idx = np.searchsorted(values2, values1).clip(max=len(values2) - 1)
+            return int(np.count_nonzero(values2[idx] == values1))
+        return int(pd.Index(values1).isin(values2).sum())
+
+    col1, _ = __split_columns(df1)
+    col2, _ = __split_columns(df2)
+    combinations = product(col1, col2)
+
+    # Prepare each column once instead of for each combination
+    values1 = {column: df1[column].dropna() for column in col1}
+    values2 = {column: df2[column].dropna() for column in col2}
+    dtypes1, dtypes2 = df1.dtypes.to_dict(), df2.dtypes.to_dict()
+    names1 = {column: column.replace(__column_name(df1),'') for column in col1}
+    names2 = {column: column.replace(__column_name(df2),'') for column in col2}
+    uniques1, uniques2 = {}, {}
+
+    pairs = []
     for combination in combinations:
-        series1 = df1[combination[0]].dropna()
-        series2 = df2[combination[1]].dropna()
-
         # Only check same dtype oder str, where column name is equal!
-        str_type = series1.dtype == 'object' and series2.dtype == 'object'
-        same_col = combination[0].replace(__column_name(df1),'') == combination[1].replace(__column_name(df2),'')
-        same_type = series1.dtype == series2.dtype
+        str_type = dtypes1[combination[0]] == 'object' and dtypes2[combination[1]] == 'object'
+        same_col = names1[combination[0]] == names2[combination[1]]
+        same_type = dtypes1[combination[0]] == dtypes2[combination[1]]
         if not ((str_type and same_col) or (same_type and not str_type)): continue
 
-        set1 = set(series1)
-        set2 = set(series2)
-        
-        if min(len(set1),len(set2)) == 0: intersecion_score = 0
-        else: intersecion_score = len(set1.intersection(set2)) / min(len(set1), len(set2))
+        pairs.append(combination)
 
-        intersection_len[tuple(combination)] = round(intersecion_score * min(len(series1.dropna()),len(series2.dropna())))
+    # Overlap cant be greater than smaller column length, so check pairs with greatest length first
+    # and stop, when remaining pairs cant reach max overlap anymore
+    upper_bound = np.array([min(len(values1[c1]), len(values2[c2])) for c1, c2 in pairs], dtype=int)
+    intersection_len = np.full(len(pairs), -1, dtype=int)
+    max_overlap = 0
+    for idx in np.argsort(-upper_bound, kind='stable'):
+        if upper_bound[idx] < max_overlap: break
+        column1, column2 = pairs[idx]
+        if column1 not in uniques1: uniques1[column1] = unique_values(values1[column1])
+        if column2 not in uniques2: uniques2[column2] = unique_values(values2[column2])
+        unique1 = uniques1[column1]
+        unique2 = uniques2[column2]
 
-    sorted_intersection = sorted(intersection_len.items(), key=lambda item: item[1], reverse=True)
-    max_overlap = 0 if len(sorted_intersection) == 0 else max([item for item in intersection_len.values()])
-    possible = {k: v for k, v in sorted_intersection if v >= max_overlap}
+        if min(len(unique1),len(unique2)) == 0: intersecion_score = 0
+        else: intersecion_score = intersection_count(unique1, unique2) / min(len(unique1), len(unique2))
+
+        intersection_len[idx] = round(intersecion_score * int(upper_bound[idx]))
+        max_overlap = max(max_overlap, int(intersection_len[idx]))
+
+    possible = [pairs[idx] for idx in np.flatnonzero(intersection_len >= max_overlap)]
     if len(possible) == 0: raise Exception("No possible join keys found.")
 
     left_key, right_key = zip(*possible)
@@ -282,6 +374,85 @@ def __join_keys(
     
     return left_key, right_key
 
+def __is_lookup(
+            df1: pd.DataFrame,
+            df2: pd.DataFrame,
+            left_key: list,
+            right_key: list
+    ) -> bool:
+    """Check if left join can be performed as lookup by join keys.
+    This is the case for unique right join keys without column name conflicts.
+
+    Parameters
+    ----------
+    df1 : pd.DataFrame
+        Main (left) dataframe for join.
+    df2 : pd.DataFrame
+        To join dataframe (right)
+    left_key : list
+        Join keys of left dataframe
+    right_key : list
+        Join keys of right dataframe
+
+    Returns
+    -------
+    bool
+        True if lookup join is possible
+    """
+    if len(set(left_key)) < len(left_key) or len(set(right_key)) < len(right_key): return False
+    duplicated = [f"{column}_duplicated" for column in df2.columns.drop(right_key) if column in df1.columns]
+    if any(column in df1.columns or column in df2.columns for column in duplicated): return False
+    return not df2.duplicated(subset=right_key).any()
+
+def __lookup_join(
+            df1: pd.DataFrame,
+            df2: pd.DataFrame,
+            left_key: list,
+            right_key: list
+    ) -> pd.DataFrame:
+    """Left join with unique right join keys by reindexing right dataframe.
+    Same result as left merge, but without the hash join of the merge.
+
+    Parameters
+    ----------
+    df1 : pd.DataFrame
+        Main (left) dataframe for join.
+    df2 : pd.DataFrame
+        To join dataframe (right) with unique join keys
+    left_key : list
+        Join keys of left dataframe
+    right_key : list
+        Join keys of right dataframe
+
+    Returns
+    -------
+    pd.DataFrame
+        Joined dataframe
+    """
+    lookup = df2.set_index(right_key)
+    keys = pd.MultiIndex.from_frame(df1[left_key]) if len(left_key) > 1 else pd.Index(df1[left_key[0]])
+    values = lookup.reindex(keys).reset_index(drop=True)
+    values.columns = [f"{column}_duplicated" if column in df1.columns else column for column in values.columns]
+
+    return pd.concat([df1.reset_index(drop=True), values], axis=1)
+
+def __split_columns(df: pd.DataFrame) -> Tuple[pd.Index, pd.Index]:
+    """Split columns of dataframe into join key columns (with global prefix) and data columns.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataframe to split
+
+    Returns
+    -------
+    Tuple[pd.Index, pd.Index]
+        Join key columns and data columns
+    """
+    prefix = config.setting['JOIN_PREFIX']
+    mask = np.fromiter((isinstance(column, str) and column.startswith(prefix) for column in df.columns), dtype=bool, count=len(df.columns))
+    return df.columns[mask], df.columns[~mask]
+
 def __column_name(df: pd.DataFrame, columns = '') -> str:
     """Return unique name for each dataframe with global prefix.
 
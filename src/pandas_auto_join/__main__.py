@@ -1,3 +1,4 @@
+import csv
 import logging
 import click
 import os
@@ -7,6 +8,15 @@ import pandas as pd
 import pandas_auto_join as aj
 from tqdm import tqdm
 
+def detect_separator(file: str) -> str:
+    """Detect CSV separator from header line, so file is parsed only once.
+    Prefer comma, semicolon as fallback. Leading blank lines are skipped like pandas does."""
+    with open(file, newline='', errors='ignore') as f:
+        header = next((line for line in f if line.strip()), '')
+
+    if len(next(csv.reader([header], delimiter=','), [])) == 1 and ';' in header: return ';'
+    return ','
+
 @click.command()
 @click.argument('files', type=click.Path(exists=True), nargs=-1, required=True)
 @click.option('--how', '-h', default='inner', show_default=True, type=click.Choice(['left', 'inner', 'outer'], case_sensitive=True), help="Pandas merge type.")
@@ -30,9 +40,7 @@ def main(files, how, strategy, threshold, output, verbose):
                     if ext == '.parquet': 
                         df = pd.read_parquet(file)
                     elif ext == '.csv':
-                        df = pd.read_csv(file, sep=',')
-                        if df.shape[1] == 1: df = pd.read_csv(file, sep=';')
-                        elif df.shape[1] == 1: df = pd.read_csv(file, sep='\s+')
+                        df = pd.read_csv(file, sep=detect_separator(file))
                     
                     df.index.name = filename
                     list_of_df.append(df)
@@ -0,0 +1,31 @@
+import pandas as pd
+import pandas_auto_join as aj
+
+from Levenshtein import ratio
+
+
+def test_similarity_equal_to_threshold_is_matched():
+    """Strings with similarity exactly at the threshold are still joined."""
+    assert ratio('BEA', 'BA') == 0.8
+    assert ratio('EDF B', 'ED BF') == 0.8
+
+    df1 = pd.DataFrame({'name': ['BEA', 'EDF B', 'XYZQW'], 'v': [1, 2, 3]})
+    df2 = pd.DataFrame({'name': ['BA', 'ED BF', 'KLMNO'], 'w': [10, 20, 30]})
+    df = aj.join(df1, df2, threshold=0.8)
+
+    assert list(df['v']) == [1, 2]
+    assert list(df['w']) == [10, 20]
+
+
+def test_similarity_blocks_equal_full_matrix(monkeypatch):
+    """Computing similarity scores in row blocks gives the same join as one full score matrix."""
+    df1 = pd.DataFrame({'name': ['ANNA', 'BERT', 'CARLA', 'DORA', 'EMIL', 'ANNA', 'FRIEDA'], 'v': range(7)})
+    df2 = pd.DataFrame({'name': ['ANA', 'BERTA', 'KARLA', 'DORIS', 'EMILE', 'OTTO'], 'w': range(6)})
+
+    monkeypatch.setattr(aj, 'SIMILARITY_BLOCK_SIZE', 10 ** 6)
+    full = aj.join(df1.copy(), df2.copy(), threshold=0.6)
+    monkeypatch.setattr(aj, 'SIMILARITY_BLOCK_SIZE', 1)
+    blocks = aj.join(df1.copy(), df2.copy(), threshold=0.6)
+
+    pd.testing.assert_frame_equal(full, blocks)
+    assert len(full) > 0